@@ -16,11 +16,15 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path
-from graphene_django.views import GraphQLView
 from django.views.decorators.csrf import csrf_exempt
 
+from crm.views import CachedGraphQLView
+
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path("graphql", csrf_exempt(GraphQLView.as_view(graphiql=True))),
+    path("graphql", csrf_exempt(CachedGraphQLView.as_view(graphiql=True))),
+    # graphene-django does not allow graphiql and batch on one view, so
+    # batched operations get their own endpoint.
+    path("graphql/batch", csrf_exempt(CachedGraphQLView.as_view(batch=True))),
 ]
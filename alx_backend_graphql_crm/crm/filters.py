@@ -0,0 +1,64 @@
+import django_filters
+from django.db import connection
+from django.db.models import CharField, Q
+from django.db.models.functions import Greatest
+
+from .models import Customer, Product, Order
+
+try:
+    # Registered here because django.contrib.postgres is not in
+    # INSTALLED_APPS (the default database is SQLite); the lookup is
+    # only used on the Postgres branch of filter_search.
+    from django.contrib.postgres.lookups import TrigramSimilar
+
+    CharField.register_lookup(TrigramSimilar)
+except ImportError:
+    pass
+
+
+class CustomerFilter(django_filters.FilterSet):
+    search = django_filters.CharFilter(method="filter_search")
+
+    class Meta:
+        model = Customer
+        fields = ["search"]
+
+    def filter_search(self, queryset, name, value):
+        if connection.vendor == "postgresql":
+            # trigram_similar compiles to the % operator, which the
+            # gin_trgm_ops index serves; a similarity() > x predicate
+            # would not use the index. The annotation only orders the
+            # matches by closeness.
+            from django.contrib.postgres.search import TrigramSimilarity
+
+            return queryset.annotate(
+                sim=Greatest(
+                    TrigramSimilarity("name", value),
+                    TrigramSimilarity("email", value),
+                )
+            ).filter(
+                Q(name__trigram_similar=value)
+                | Q(email__trigram_similar=value)
+            ).order_by("-sim")
+        return queryset.filter(name__icontains=value) | queryset.filter(
+            email__icontains=value)
+
+
+class ProductFilter(django_filters.FilterSet):
+    in_stock = django_filters.BooleanFilter(method="filter_in_stock")
+
+    class Meta:
+        model = Product
+        fields = ["in_stock"]
+
+    def filter_in_stock(self, queryset, name, value):
+        return queryset.filter(stock__gt=0) if value else queryset.filter(
+            stock=0)
+
+
+class OrderFilter(django_filters.FilterSet):
+    customer_id = django_filters.NumberFilter()
+
+    class Meta:
+        model = Order
+        fields = ["customer_id"]
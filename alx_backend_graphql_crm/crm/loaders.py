@@ -0,0 +1,42 @@
+"""Per-request loaders that collapse repeated row lookups.
+
+The schema executes synchronously under WSGI, so there is no event loop
+to coalesce pending loads the way an async DataLoader would. These
+loaders memoize per request instead and fetch misses with a single IN
+query via load_many, which covers the same duplicate-fetch pattern:
+the same customer appearing under many orders, or several query roots
+touching the same rows.
+"""
+
+from .models import Customer
+
+
+class CustomerLoader:
+    """Caches Customer rows by primary key for one request."""
+
+    def __init__(self):
+        self._cache = {}
+
+    def prime(self, customer):
+        self._cache[customer.pk] = customer
+
+    def load(self, customer_id):
+        if customer_id not in self._cache:
+            self.load_many([customer_id])
+        return self._cache.get(customer_id)
+
+    def load_many(self, customer_ids):
+        missing = [cid for cid in customer_ids if cid not in self._cache]
+        if missing:
+            for customer in Customer.objects.filter(id__in=missing):
+                self._cache[customer.pk] = customer
+        return [self._cache.get(cid) for cid in customer_ids]
+
+
+def get_customer_loader(context):
+    """Return the request-scoped CustomerLoader, creating it on first use."""
+    loader = getattr(context, "customer_loader", None)
+    if loader is None:
+        loader = CustomerLoader()
+        context.customer_loader = loader
+    return loader
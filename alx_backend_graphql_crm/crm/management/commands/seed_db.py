@@ -17,10 +17,25 @@ class Command(BaseCommand):
             {"name": "Phone", "price": 800},
         ]
 
-        for c in customers:
-            Customer.objects.get_or_create(**c)
+        # One INSERT per table instead of a SELECT+INSERT pair per row.
+        # The unique email constraint makes ignore_conflicts behave like
+        # get_or_create for customers.
+        Customer.objects.bulk_create(
+            [Customer(**c) for c in customers],
+            ignore_conflicts=True,
+            batch_size=1000,
+        )
 
-        for p in products:
-            Product.objects.get_or_create(**p)
+        # Products have no unique column, so skip names that already
+        # exist to keep reseeding idempotent.
+        existing = set(
+            Product.objects.filter(
+                name__in=[p["name"] for p in products]
+            ).values_list("name", flat=True)
+        )
+        Product.objects.bulk_create(
+            [Product(**p) for p in products if p["name"] not in existing],
+            batch_size=1000,
+        )
 
         self.stdout.write(self.style.SUCCESS("Database seeded successfully!"))
@@ -0,0 +1,30 @@
+from django.db import migrations
+
+
+def add_trigram_index(apps, schema_editor):
+    # pg_trgm and GIN indexes are Postgres-only; SQLite keeps using the
+    # icontains fallback in resolve_customers.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS cust_trgm_idx ON crm_customer "
+        "USING gin (name gin_trgm_ops, email gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS cust_trgm_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_trigram_index, drop_trigram_index),
+    ]
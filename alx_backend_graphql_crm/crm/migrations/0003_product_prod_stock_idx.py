@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-31 08:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0002_customer_trigram_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('stock__gt', 0)), fields=['stock'], name='prod_stock_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.17 on 2026-08-31 08:37
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models.functions import Lower, Trim
+
+
+def normalize_emails(apps, schema_editor):
+    # Pre-existing rows must match what Customer.save() now stores, or
+    # the exact-match pre-checks miss them and the constraint below can
+    # fail on case-variant duplicates.
+    Customer = apps.get_model('crm', 'Customer')
+    Customer.objects.update(email=Lower(Trim('email')))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0003_product_prod_stock_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='customer',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='customer_email_ci_uniq'),
+        ),
+    ]
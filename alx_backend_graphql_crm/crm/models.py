@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
 
 
@@ -7,6 +8,18 @@ class Customer(models.Model):
     email = models.EmailField(unique=True)
     phone = models.CharField(max_length=20, blank=True, null=True)
 
+    class Meta:
+        constraints = [
+            # Case-insensitive uniqueness so Alice@Example.com and
+            # alice@example.com collide at the database level.
+            models.UniqueConstraint(
+                Lower("email"), name="customer_email_ci_uniq"),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.email = self.email.strip().lower()
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.name
 
@@ -16,6 +29,17 @@ class Product(models.Model):
     price = models.DecimalField(max_digits=10, decimal_places=2)
     stock = models.PositiveIntegerField(default=0)
 
+    class Meta:
+        indexes = [
+            # Partial index matching the in-stock listing predicate so
+            # stock__gt=0 queries avoid a full table scan.
+            models.Index(
+                fields=["stock"],
+                name="prod_stock_idx",
+                condition=models.Q(stock__gt=0),
+            ),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -31,10 +55,16 @@ class Order(models.Model):
     def calculate_total(self):
         return sum(product.price for product in self.products.all())
 
-    def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
-        self.total_amount = self.calculate_total()
-        super().save(update_fields=["total_amount"])
+    def recalculate_total(self, products=None):
+        """Persist total_amount with a single UPDATE.
+
+        Pass an already-loaded iterable of products to avoid the extra
+        SELECT that self.products.all() would issue.
+        """
+        if products is None:
+            products = self.products.all()
+        self.total_amount = sum(product.price for product in products)
+        Order.objects.filter(pk=self.pk).update(total_amount=self.total_amount)
 
     def __str__(self):
         return f"Order {self.id} - {self.customer.name}"
@@ -1,14 +1,47 @@
 import re
 import graphene
 from decimal import Decimal, InvalidOperation
-from graphene_django import DjangoObjectType
-from django.core.exceptions import ValidationError
-from django.db import transaction
+from graphene_django import DjangoObjectType, bypass_get_queryset
+from graphql import GraphQLError, Undefined
+from graphql.language import ast
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
 from django.utils import timezone
 from graphene_django.filter import DjangoFilterConnectionField
 from .filters import CustomerFilter, ProductFilter, OrderFilter
+from .loaders import get_customer_loader
 from .models import Customer, Product, Order
 
+# Compiled once at import; also used instead of full_clean() in bulk
+# paths, where the per-row unique check would re-query the database.
+_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+
+
+class DecimalScalar(graphene.Scalar):
+    """Exact decimal transported as a string.
+
+    Parsing happens during argument coercion, so resolvers receive a
+    ready Decimal and malformed input is rejected before they run.
+    """
+
+    @staticmethod
+    def serialize(value):
+        return str(value)
+
+    @staticmethod
+    def parse_value(value):
+        try:
+            return Decimal(value)
+        except (InvalidOperation, TypeError):
+            raise GraphQLError(f"Invalid decimal value: {value!r}")
+
+    @staticmethod
+    def parse_literal(node, _variables=None):
+        if isinstance(node, (ast.StringValueNode, ast.IntValueNode,
+                             ast.FloatValueNode)):
+            return DecimalScalar.parse_value(node.value)
+        return Undefined
+
 # === TYPES ===
 
 
@@ -16,24 +49,79 @@ class CustomerType(DjangoObjectType):
     class Meta:
         model = Customer
         fields = ("id", "name", "email", "phone")
+        interfaces = (graphene.relay.Node,)
+
+    @classmethod
+    def get_queryset(cls, queryset, info):
+        return queryset.only("id", "name", "email", "phone").order_by("pk")
 
 
 class ProductType(DjangoObjectType):
     class Meta:
         model = Product
         fields = ("id", "name", "price", "stock")
+        interfaces = (graphene.relay.Node,)
+
+    @classmethod
+    def get_queryset(cls, queryset, info):
+        return queryset.only("id", "name", "price", "stock").order_by("pk")
 
 
 class OrderType(DjangoObjectType):
     class Meta:
         model = Order
         fields = ("id", "customer", "products", "total_amount", "order_date")
-
-    # Example: format the date for clarity
+        interfaces = (graphene.relay.Node,)
+
+    # Keep the M2M a plain list: the auto-generated nested connection
+    # would bypass the prefetch cache and query per order, while
+    # self.products.all() is served from it.
+    products = graphene.List(ProductType)
+
+    def resolve_products(self, info):
+        return self.products.all()
+
+    # Without the bypass, graphene-django routes FK access through
+    # CustomerType.get_queryset via get_node, one SELECT per order,
+    # regardless of select_related.
+    @bypass_get_queryset
+    def resolve_customer(self, info):
+        # select_related already fills the FK cache for list queries;
+        # the loader dedupes customer fetches that prefetching cannot
+        # see, e.g. the same customer under multiple query roots.
+        # Joined rows prime the loader so those roots benefit too.
+        if info.context is None:
+            return self.customer
+        loader = get_customer_loader(info.context)
+        if "customer" in self._state.fields_cache:
+            loader.prime(self.customer)
+            return self.customer
+        return loader.load(self.customer_id)
+
+    @classmethod
+    def get_queryset(cls, queryset, info):
+        # JOIN the customer and batch-fetch products so serializing N
+        # orders stays at a constant number of queries. The customer
+        # columns must be listed in only() or they would be deferred,
+        # reintroducing one query per order.
+        return queryset.select_related("customer").prefetch_related(
+            "products"
+        ).only(
+            "id", "total_amount", "order_date",
+            "customer__id", "customer__name",
+            "customer__email", "customer__phone",
+        ).order_by("pk")
+
+    # Example: format the date for clarity. isoformat produces the same
+    # "YYYY-MM-DD HH:MM:SS" string as the old strftime call but through
+    # CPython's C implementation, which matters on large order lists.
     order_date = graphene.String()
 
     def resolve_order_date(self, info):
-        return self.order_date.strftime("%Y-%m-%d %H:%M:%S")
+        # tzinfo is dropped so the aware datetime does not append an
+        # UTC offset the old format never had.
+        return self.order_date.replace(tzinfo=None).isoformat(
+            sep=" ", timespec="seconds")
 
 
 # === INPUTS ===
@@ -54,15 +142,16 @@ class CreateCustomer(graphene.Mutation):
     message = graphene.String()
 
     def mutate(self, info, name, email, phone=None):
-        if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
+        if not _EMAIL_RE.match(email):
             raise Exception("Invalid email format")
 
-        if Customer.objects.filter(email=email).exists():
-            raise Exception("Email already exists")
-
+        # Let the UNIQUE constraint catch duplicates: one INSERT instead
+        # of the exists() + full_clean() + save() triple.
         customer = Customer(name=name, email=email, phone=phone)
-        customer.full_clean()
-        customer.save()
+        try:
+            customer.save()
+        except IntegrityError:
+            raise Exception("Email already exists")
         return CreateCustomer(customer=customer, message="Customer created successfully!")
 
 
@@ -74,23 +163,45 @@ class BulkCreateCustomers(graphene.Mutation):
     errors = graphene.List(graphene.String)
 
     def mutate(self, info, customers):
-        created = []
         errors = []
 
+        # Validate and deduplicate in memory, then check all emails
+        # against the database with a single IN query instead of one
+        # exists() per input.
+        incoming = {}
         for data in customers:
-            try:
-                if Customer.objects.filter(email=data.email).exists():
-                    errors.append(f"Duplicate email: {data.email}")
-                    continue
-
-                customer = Customer(
-                    name=data.name, email=data.email, phone=data.phone
+            # Normalized here because bulk_create bypasses
+            # Customer.save().
+            email = data.email.strip().lower()
+            if not _EMAIL_RE.match(email):
+                errors.append(f"Invalid email: {data.email}")
+            elif email in incoming:
+                errors.append(f"Duplicate email: {email}")
+            else:
+                incoming[email] = data
+
+        existing = set(
+            Customer.objects.filter(
+                email__in=incoming).values_list("email", flat=True)
+        )
+        errors.extend(f"Duplicate email: {email}" for email in existing)
+
+        # A row inserted between the pre-check and here can still trip
+        # the UNIQUE constraint; report it like CreateCustomer does
+        # instead of leaking a raw database error.
+        try:
+            with transaction.atomic():
+                created = Customer.objects.bulk_create(
+                    [
+                        Customer(name=data.name, email=email, phone=data.phone)
+                        for email, data in incoming.items()
+                        if email not in existing
+                    ],
+                    batch_size=500,
                 )
-                customer.full_clean()
-                customer.save()
-                created.append(customer)
-            except ValidationError as e:
-                errors.append(str(e))
+        except IntegrityError:
+            created = []
+            errors.append("Email already exists")
 
         return BulkCreateCustomers(customers=created, errors=errors)
 
@@ -98,25 +209,19 @@ class BulkCreateCustomers(graphene.Mutation):
 class CreateProduct(graphene.Mutation):
     class Arguments:
         name = graphene.String(required=True)
-        # use string to safely handle Decimal
-        price = graphene.String(required=True)
+        price = DecimalScalar(required=True)
         stock = graphene.Int(required=False, default_value=0)
 
     product = graphene.Field(ProductType)
     message = graphene.String()
 
     def mutate(self, info, name, price, stock=0):
-        try:
-            price_decimal = Decimal(price)
-        except InvalidOperation:
-            raise Exception("Invalid price format")
-
-        if price_decimal <= 0:
+        if price <= 0:
             raise Exception("Price must be positive")
         if stock < 0:
             raise Exception("Stock cannot be negative")
 
-        product = Product(name=name, price=price_decimal, stock=stock)
+        product = Product(name=name, price=price, stock=stock)
         product.save()
         return CreateProduct(product=product, message="Product created successfully!")
 
@@ -139,25 +244,52 @@ class CreateOrder(graphene.Mutation):
         if not product_ids:
             raise Exception("At least one product is required")
 
-        products = Product.objects.select_for_update().filter(id__in=product_ids)
-        if products.count() != len(product_ids):
+        # Lock only the product rows (FOR NO KEY UPDATE OF ... on
+        # Postgres): concurrent stock decrements still serialize, but
+        # inserts referencing the locked products are not blocked.
+        # Backends without these options fall back to the plain lock.
+        lock_args = {}
+        if connection.features.has_select_for_update_of:
+            lock_args["of"] = ("self",)
+        if connection.features.has_select_for_no_key_update:
+            lock_args["no_key"] = True
+
+        # Evaluate the locked rows once: len() on the list replaces the
+        # SELECT COUNT(*) the queryset would otherwise issue, and the
+        # same list feeds the stock check, the M2M set and the total.
+        products = list(
+            Product.objects.select_for_update(**lock_args)
+            .filter(id__in=product_ids)
+            .only("id", "name", "price", "stock")
+        )
+        if len(products) != len(set(product_ids)):
             raise Exception("Some product IDs are invalid")
 
-        # Ensure stock availability
-        for product in products:
-            if product.stock <= 0:
-                raise Exception(f"Product '{product.name}' is out of stock")
+        # Ensure stock availability; the rows are already locked and in
+        # memory, so report every shortage in one pass.
+        out_of_stock = [p.name for p in products if p.stock <= 0]
+        if out_of_stock:
+            raise Exception(f"Out of stock: {', '.join(out_of_stock)}")
 
         # Deduct stock and create order
         order = Order(customer=customer, order_date=timezone.now())
         order.save()
         order.products.set(products)
 
-        for product in products:
-            product.stock -= 1
-            product.save()
-
-        order.save()  # triggers total calculation
+        # One UPDATE for all products instead of one per row; the rows are
+        # already locked by select_for_update above. The stock__gt=0
+        # guard makes check-and-decrement atomic at the database layer,
+        # and a short row count rolls the whole order back. If
+        # per-product quantities are ever added, decrement on the
+        # instances and use bulk_update(products, ['stock']) instead.
+        updated = Product.objects.filter(
+            id__in=product_ids, stock__gt=0).update(stock=F("stock") - 1)
+        if updated != len(products):
+            raise Exception("Stock changed while processing the order")
+
+        # The queryset is already evaluated by the stock check, so the
+        # total is computed without another SELECT.
+        order.recalculate_total(products=products)
         return CreateOrder(order=order, message="Order created successfully!")
 
 
@@ -171,28 +303,16 @@ class Mutation(graphene.ObjectType):
 
 # === QUERY CLASS ===
 class Query(graphene.ObjectType):
-    customers = graphene.List(CustomerType, search=graphene.String())
-    products = graphene.List(ProductType, in_stock=graphene.Boolean())
-    orders = graphene.List(OrderType, customer_id=graphene.ID())
-
-    def resolve_customers(self, info, search=None):
-        qs = Customer.objects.all()
-        if search:
-            qs = qs.filter(name__icontains=search) | qs.filter(
-                email__icontains=search)
-        return qs
-
-    def resolve_products(self, info, in_stock=None):
-        qs = Product.objects.all()
-        if in_stock is not None:
-            qs = qs.filter(stock__gt=0) if in_stock else qs.filter(stock=0)
-        return qs
-
-    def resolve_orders(self, info, customer_id=None):
-        qs = Order.objects.all()
-        if customer_id:
-            qs = qs.filter(customer_id=customer_id)
-        return qs
+    # Cursor-paginated connections with a hard page cap, so a query can
+    # no longer pull an entire table into memory. Filtering (search,
+    # in_stock, customer_id) lives in the filterset classes and the
+    # per-type optimizations in get_queryset.
+    customers = DjangoFilterConnectionField(
+        CustomerType, filterset_class=CustomerFilter, max_limit=100)
+    products = DjangoFilterConnectionField(
+        ProductType, filterset_class=ProductFilter, max_limit=100)
+    orders = DjangoFilterConnectionField(
+        OrderType, filterset_class=OrderFilter, max_limit=100)
 
 
 # === ROOT SCHEMA ===
@@ -1,3 +1,21 @@
-from django.shortcuts import render
+from functools import lru_cache
 
-# Create your views here.
+import graphene_django.views as graphene_views
+from graphene_django.views import GraphQLView
+from graphql import parse
+
+
+@lru_cache(maxsize=1024)
+def _parse_cached(query):
+    """Parse a query string once and reuse the AST on repeats."""
+    return parse(query)
+
+
+# GraphQLView calls the module-level parse() in graphene_django.views;
+# routing it through the LRU lets repeated query strings skip the
+# parser entirely. Parse errors propagate without being cached.
+graphene_views.parse = _parse_cached
+
+
+class CachedGraphQLView(GraphQLView):
+    """GraphQLView whose import activates the parsed-query cache."""